@@ -0,0 +1,26 @@
+`timescale 1ns / 1ps
+
+// Gerado por scripts/adder_gen.py: arquitetura=behavioral, W=128, N_OPS=16
+module adder_tree_Nbits (
+    input  wire [2047:0] ops,  // operandos packed
+    output wire [127:0] sum
+);
+
+  wire [127:0] s0_0 = ops[0+:128] + ops[128+:128];
+  wire [127:0] s0_1 = ops[256+:128] + ops[384+:128];
+  wire [127:0] s0_2 = ops[512+:128] + ops[640+:128];
+  wire [127:0] s0_3 = ops[768+:128] + ops[896+:128];
+  wire [127:0] s0_4 = ops[1024+:128] + ops[1152+:128];
+  wire [127:0] s0_5 = ops[1280+:128] + ops[1408+:128];
+  wire [127:0] s0_6 = ops[1536+:128] + ops[1664+:128];
+  wire [127:0] s0_7 = ops[1792+:128] + ops[1920+:128];
+  wire [127:0] s1_0 = s0_0 + s0_1;
+  wire [127:0] s1_1 = s0_2 + s0_3;
+  wire [127:0] s1_2 = s0_4 + s0_5;
+  wire [127:0] s1_3 = s0_6 + s0_7;
+  wire [127:0] s2_0 = s1_0 + s1_1;
+  wire [127:0] s2_1 = s1_2 + s1_3;
+  wire [127:0] s3_0 = s2_0 + s2_1;
+  assign sum = s3_0;
+
+endmodule
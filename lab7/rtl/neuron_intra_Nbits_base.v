@@ -30,24 +30,14 @@ module neuron_intra_Nbits #(
     end
   endgenerate
 
-  // Soma de todos os produtos
-  genvar j, k;
-  generate
-    for (j = 0; j < LOG_N_INPUTS; j = j + 1) begin : ADDER_TREE
-      wire signed [2*N*(N_INPUTS >> (j+1))-1:0] sum_stage;
-      if(j == 0) begin
-        for (k = 0; k < (N_INPUTS >> (j+1)); k = k + 1) begin : STAGE0
-          assign sum_stage[2*k*N+:2*N] = prod[2*k*2*N+:2*N] + prod[(2*k+1)*2*N+:2*N];
-        end
-      end else begin
-        for (k = 0; k < (N_INPUTS >> (j+1)); k = k + 1) begin : STAGEJ
-          assign sum_stage[2*k*N+:2*N] = ADDER_TREE[j-1].sum_stage[2*k*2*N+:2*N] + ADDER_TREE[j-1].sum_stage[(2*k+1)*2*N+:2*N];
-        end
-      end
-    end
-    wire signed [2*N-1:0] sum_all;
-    assign sum_all = ADDER_TREE[LOG_N_INPUTS-1].sum_stage;
-  endgenerate
+  // Soma de todos os produtos: a arquitetura da árvore (rca, cla, ks, ...)
+  // é gerada por scripts/adder_gen.py em adder_tree_Nbits.v
+  wire signed [2*N-1:0] sum_all;
+
+  adder_tree_Nbits adder_tree (
+      .ops(prod),
+      .sum(sum_all)
+  );
 
 
   // Registrador do acumulador
@@ -0,0 +1,490 @@
+"""
+Gerador de árvores de somadores para o neuron_intra_Nbits.
+
+Este módulo gera, em Verilog estrutural, a árvore que soma os produtos
+do neuron_intra_Nbits usando diferentes arquiteturas de somador:
+
+- behavioral: árvore binária com o operador ``+`` (escolha do Genus).
+- rca: ripple-carry.
+- cla: carry-lookahead em blocos de 4 bits.
+- csel: carry-select em blocos de ~sqrt(W) bits.
+- ks: prefixo paralelo Kogge-Stone.
+- bk: prefixo paralelo Brent-Kung.
+- wallace: redução carry-save (Wallace) de todos os operandos seguida
+  de um somador final Kogge-Stone.
+
+Cada arquitetura é descrita como uma netlist de portas lógicas, que é usada
+tanto para emitir o Verilog quanto para a verificação funcional. A
+verificação é vetorizada por bit-slicing: cada fio é um inteiro Python em
+que o bit v carrega o valor do fio no vetor de teste v, de modo que cada
+porta é avaliada para todos os vetores com uma única operação.
+"""
+
+import math
+import random
+
+
+ZERO = "1'b0"
+ONE = "1'b1"
+
+ADDER_ARCHS = ('behavioral', 'rca', 'cla', 'csel', 'ks', 'bk', 'wallace')
+
+
+class Netlist:
+    """
+    Netlist combinacional de portas lógicas com propagação de constantes.
+
+    Cada porta é uma tupla ``(saida, op, entradas)``, com ``op`` em
+    ``and``, ``or``, ``xor``, ``not`` ou ``mux``.
+    """
+
+    def __init__(self):
+        self.gates = []
+
+    def _gate(self, op, *args):
+        name = f'n{len(self.gates)}'
+        self.gates.append((name, op, args))
+        return name
+
+    def and_(self, *args):
+        if ZERO in args:
+            return ZERO
+        args = [a for a in args if a != ONE]
+        if not args:
+            return ONE
+        if len(args) == 1:
+            return args[0]
+        return self._gate('and', *args)
+
+    def or_(self, *args):
+        if ONE in args:
+            return ONE
+        args = [a for a in args if a != ZERO]
+        if not args:
+            return ZERO
+        if len(args) == 1:
+            return args[0]
+        return self._gate('or', *args)
+
+    def xor(self, *args):
+        invert = args.count(ONE) % 2 == 1
+        args = [a for a in args if a not in (ZERO, ONE)]
+        if not args:
+            return ONE if invert else ZERO
+        out = args[0] if len(args) == 1 else self._gate('xor', *args)
+        return self.not_(out) if invert else out
+
+    def not_(self, a):
+        if a == ZERO:
+            return ONE
+        if a == ONE:
+            return ZERO
+        return self._gate('not', a)
+
+    def mux(self, sel, a, b):
+        """Retorna ``b`` quando ``sel`` vale 1 e ``a`` caso contrário."""
+        if sel == ZERO or a == b:
+            return a
+        if sel == ONE:
+            return b
+        return self._gate('mux', sel, a, b)
+
+
+def full_adder(nl, a, b, cin):
+    """Somador completo de 1 bit. Retorna (soma, carry)."""
+    s = nl.xor(a, b, cin)
+    cout = nl.or_(nl.and_(a, b), nl.and_(a, cin), nl.and_(b, cin))
+    return s, cout
+
+
+def half_adder(nl, a, b):
+    """Meio somador de 1 bit. Retorna (soma, carry)."""
+    return nl.xor(a, b), nl.and_(a, b)
+
+
+def _ripple(nl, a, b, cin):
+    sums = []
+    c = cin
+    for ai, bi in zip(a, b):
+        s, c = full_adder(nl, ai, bi, c)
+        sums.append(s)
+    return sums, c
+
+
+def adder_rca(nl, a, b):
+    """Somador ripple-carry (bits LSB primeiro, resultado módulo 2^W)."""
+    sums, _ = _ripple(nl, a, b, ZERO)
+    return sums
+
+
+def adder_cla(nl, a, b, block=4):
+    """Somador carry-lookahead em blocos, com carry propagado entre blocos."""
+    width = len(a)
+    g = [nl.and_(ai, bi) for ai, bi in zip(a, b)]
+    p = [nl.xor(ai, bi) for ai, bi in zip(a, b)]
+    sums = []
+    cin = ZERO
+    for start in range(0, width, block):
+        end = min(start + block, width)
+        c = cin
+        for j in range(start, end):
+            sums.append(nl.xor(p[j], c))
+            # c_{j+1} = g_j | p_j g_{j-1} | ... | p_j ... p_start cin
+            terms = [g[j]]
+            for m in range(j - 1, start - 1, -1):
+                terms.append(nl.and_(*p[m + 1:j + 1], g[m]))
+            terms.append(nl.and_(*p[start:j + 1], cin))
+            c = nl.or_(*terms)
+        cin = c
+    return sums
+
+
+def adder_csel(nl, a, b, block=None):
+    """Somador carry-select com blocos ripple duplicados para cin=0 e cin=1."""
+    width = len(a)
+    if block is None:
+        block = max(2, round(math.sqrt(width)))
+    sums, c = _ripple(nl, a[:block], b[:block], ZERO)
+    for start in range(block, width, block):
+        a_blk = a[start:start + block]
+        b_blk = b[start:start + block]
+        s0, c0 = _ripple(nl, a_blk, b_blk, ZERO)
+        s1, c1 = _ripple(nl, a_blk, b_blk, ONE)
+        sums += [nl.mux(c, x0, x1) for x0, x1 in zip(s0, s1)]
+        c = nl.mux(c, c0, c1)
+    return sums
+
+
+def _prefix_sums(nl, p, G):
+    # Com cin=0, o carry do bit i é o generate de prefixo G[i-1]
+    carries = [ZERO] + G[:-1]
+    return [nl.xor(pi, ci) for pi, ci in zip(p, carries)]
+
+
+def adder_ks(nl, a, b):
+    """Somador de prefixo paralelo Kogge-Stone."""
+    width = len(a)
+    G = [nl.and_(ai, bi) for ai, bi in zip(a, b)]
+    p = [nl.xor(ai, bi) for ai, bi in zip(a, b)]
+    P = list(p)
+    d = 1
+    while d < width:
+        G_next, P_next = list(G), list(P)
+        for i in range(d, width):
+            G_next[i] = nl.or_(G[i], nl.and_(P[i], G[i - d]))
+            P_next[i] = nl.and_(P[i], P[i - d])
+        G, P = G_next, P_next
+        d *= 2
+    return _prefix_sums(nl, p, G)
+
+
+def adder_bk(nl, a, b):
+    """Somador de prefixo paralelo Brent-Kung."""
+    width = len(a)
+    G = [nl.and_(ai, bi) for ai, bi in zip(a, b)]
+    p = [nl.xor(ai, bi) for ai, bi in zip(a, b)]
+    P = list(p)
+
+    def combine(i, j):
+        G[i] = nl.or_(G[i], nl.and_(P[i], G[j]))
+        P[i] = nl.and_(P[i], P[j])
+
+    # Árvore de subida: prefixos completos nas posições 2^k - 1
+    distances = []
+    d = 1
+    while d < width:
+        distances.append(d)
+        for i in range(2 * d - 1, width, 2 * d):
+            combine(i, i - d)
+        d *= 2
+
+    # Árvore de descida: completa os prefixos das posições restantes
+    for d in reversed(distances):
+        for i in range(3 * d - 1, width, 2 * d):
+            combine(i, i - d)
+
+    return _prefix_sums(nl, p, G)
+
+
+ADDERS = {
+    'rca': adder_rca,
+    'cla': adder_cla,
+    'csel': adder_csel,
+    'ks': adder_ks,
+    'bk': adder_bk,
+}
+
+
+def wallace_reduction(nl, operands, final_arch='ks'):
+    """
+    Soma vários operandos com redução carry-save (Wallace).
+
+    Cada coluna de bits é reduzida com somadores completos e meios
+    somadores até restarem no máximo dois bits por coluna, que são somados
+    pelo somador final ``final_arch``. Carries além do bit W-1 são
+    descartados (soma módulo 2^W).
+    """
+    width = len(operands[0])
+    cols = [[op[i] for op in operands] for i in range(width)]
+    while max(len(col) for col in cols) > 2:
+        reduced = [[] for _ in range(width)]
+        for i, col in enumerate(cols):
+            j = 0
+            while len(col) - j >= 3:
+                s, c = full_adder(nl, col[j], col[j + 1], col[j + 2])
+                reduced[i].append(s)
+                if i + 1 < width:
+                    reduced[i + 1].append(c)
+                j += 3
+            if len(col) - j == 2:
+                s, c = half_adder(nl, col[j], col[j + 1])
+                reduced[i].append(s)
+                if i + 1 < width:
+                    reduced[i + 1].append(c)
+            elif len(col) - j == 1:
+                reduced[i].append(col[j])
+        cols = reduced
+
+    a = [col[0] if len(col) > 0 else ZERO for col in cols]
+    b = [col[1] if len(col) > 1 else ZERO for col in cols]
+    return ADDERS[final_arch](nl, a, b)
+
+
+def build_adder_tree(arch, width, n_ops):
+    """
+    Monta a netlist da árvore de somadores.
+
+    Parameters
+    ----------
+    arch : str
+        Arquitetura estrutural (qualquer item de ADDER_ARCHS exceto
+        ``behavioral``).
+    width : int
+        Largura W de cada operando e do resultado.
+    n_ops : int
+        Número de operandos somados.
+
+    Returns
+    -------
+    tuple
+        (netlist, lista com os W bits de saída, LSB primeiro)
+    """
+    if arch != 'wallace' and arch not in ADDERS:
+        raise ValueError(f"Arquitetura de somador sem netlist: {arch}")
+
+    nl = Netlist()
+    operands = [[f'ops[{k * width + i}]' for i in range(width)] for k in range(n_ops)]
+
+    if arch == 'wallace':
+        return nl, wallace_reduction(nl, operands)
+
+    # Mesma árvore binária do neuron_intra_Nbits: soma os pares (2k, 2k+1)
+    level = operands
+    while len(level) > 1:
+        next_level = [ADDERS[arch](nl, level[k], level[k + 1])
+                      for k in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return nl, level[0]
+
+
+_OPS_VERILOG = {'and': ' & ', 'or': ' | ', 'xor': ' ^ '}
+
+
+def _emit_behavioral(width, n_ops):
+    lines = []
+    level = [f'ops[{k * width}+:{width}]' for k in range(n_ops)]
+    depth = 0
+    while len(level) > 1:
+        next_level = []
+        for k in range(0, len(level) - 1, 2):
+            name = f's{depth}_{k // 2}'
+            lines.append(f'  wire [{width - 1}:0] {name} = {level[k]} + {level[k + 1]};')
+            next_level.append(name)
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+        depth += 1
+    lines.append(f'  assign sum = {level[0]};')
+    return lines
+
+
+def _emit_netlist(nl, outputs):
+    lines = []
+    for name, op, args in nl.gates:
+        if op == 'not':
+            expr = f'~{args[0]}'
+        elif op == 'mux':
+            expr = f'{args[0]} ? {args[2]} : {args[1]}'
+        else:
+            expr = _OPS_VERILOG[op].join(args)
+        lines.append(f'  wire {name} = {expr};')
+    for i, bit in enumerate(outputs):
+        lines.append(f'  assign sum[{i}] = {bit};')
+    return lines
+
+
+def write_adder_tree(v_path, arch, width, n_ops):
+    """
+    Gera o módulo Verilog adder_tree_Nbits para a arquitetura escolhida.
+
+    Parameters
+    ----------
+    v_path : str
+        Caminho de saída do arquivo Verilog.
+    arch : str
+        Arquitetura do somador (um item de ADDER_ARCHS).
+    width : int
+        Largura W de cada operando e do resultado.
+    n_ops : int
+        Número de operandos somados.
+    """
+    if arch not in ADDER_ARCHS:
+        raise ValueError(f"Arquitetura de somador desconhecida: {arch}")
+
+    if arch == 'behavioral':
+        body = _emit_behavioral(width, n_ops)
+    else:
+        body = _emit_netlist(*build_adder_tree(arch, width, n_ops))
+
+    lines = [
+        '`timescale 1ns / 1ps',
+        '',
+        f'// Gerado por scripts/adder_gen.py: arquitetura={arch}, W={width}, N_OPS={n_ops}',
+        'module adder_tree_Nbits (',
+        f'    input  wire [{n_ops * width - 1}:0] ops,  // operandos packed',
+        f'    output wire [{width - 1}:0] sum',
+        ');',
+        '',
+    ] + body + ['', 'endmodule', '']
+
+    with open(v_path, 'w', encoding='utf-8') as v_file:
+        v_file.write('\n'.join(lines))
+
+    print(f"[OK] Árvore de somadores gerada: arquitetura={arch}, W={width}, N_OPS={n_ops}")
+
+
+def _simulate(nl, inputs, mask):
+    values = {ZERO: 0, ONE: mask}
+    values.update(inputs)
+    for name, op, args in nl.gates:
+        x = [values[a] for a in args]
+        if op == 'and':
+            v = x[0]
+            for xi in x[1:]:
+                v &= xi
+        elif op == 'or':
+            v = x[0]
+            for xi in x[1:]:
+                v |= xi
+        elif op == 'xor':
+            v = x[0]
+            for xi in x[1:]:
+                v ^= xi
+        elif op == 'not':
+            v = mask ^ x[0]
+        else:
+            sel, a, b = x
+            v = (sel & b) | ((mask ^ sel) & a)
+        values[name] = v
+    return values
+
+
+def _bit_slice(words, width):
+    # Transpõe N palavras de W bits em W inteiros de N bits (um por posição)
+    slices = [0] * width
+    for v, word in enumerate(words):
+        for i in range(width):
+            if (word >> i) & 1:
+                slices[i] |= 1 << v
+    return slices
+
+
+def check_adder_tree(arch, width, n_ops, n_vectors=256, seed=0):
+    """
+    Verifica funcionalmente a árvore de somadores contra a soma módulo 2^W.
+
+    Além de vetores aleatórios, inclui casos de propagação de carry ao
+    longo de toda a palavra (todos os bits em 1, -1 + 1, etc).
+
+    Parameters
+    ----------
+    arch : str
+        Arquitetura do somador (um item de ADDER_ARCHS).
+    width : int
+        Largura W de cada operando e do resultado.
+    n_ops : int
+        Número de operandos somados.
+    n_vectors : int
+        Número de vetores aleatórios.
+    seed : int
+        Semente do gerador aleatório.
+
+    Returns
+    -------
+    bool
+        True se todos os vetores produziram a soma esperada.
+    """
+    if arch == 'behavioral':
+        print("[INFO] Arquitetura behavioral usa o operador + (sem netlist para verificar).")
+        return True
+
+    rng = random.Random(seed)
+    all_ones = (1 << width) - 1
+    vectors = [
+        [0] * n_ops,
+        [all_ones] * n_ops,
+        [all_ones, 1] + [0] * (n_ops - 2),
+        [1 << (width - 1)] * n_ops,
+    ]
+    vectors = [v[:n_ops] for v in vectors]
+    vectors += [[rng.getrandbits(width) for _ in range(n_ops)] for _ in range(n_vectors)]
+
+    inputs = {}
+    for k in range(n_ops):
+        for i, bits in enumerate(_bit_slice([v[k] for v in vectors], width)):
+            inputs[f'ops[{k * width + i}]'] = bits
+
+    nl, outputs = build_adder_tree(arch, width, n_ops)
+    mask = (1 << len(vectors)) - 1
+    values = _simulate(nl, inputs, mask)
+    expected = _bit_slice([sum(v) & all_ones for v in vectors], width)
+
+    failed = 0
+    for bit, exp in zip(outputs, expected):
+        failed |= values[bit] ^ exp
+    errors = bin(failed).count('1')
+
+    if errors:
+        print(f"[ERRO] Verificação de {arch} (W={width}, N_OPS={n_ops}) falhou "
+              f"em {errors} de {len(vectors)} vetores")
+        return False
+
+    print(f"[OK] Verificação de {arch} (W={width}, N_OPS={n_ops}): "
+          f"{len(vectors)} vetores corretos, {len(nl.gates)} portas")
+    return True
+
+
+def main():
+    """
+    Verifica todas as arquiteturas para as larguras usadas na DSE.
+
+    Returns
+    -------
+    None
+    """
+    ok = True
+    for arch in ADDER_ARCHS:
+        for width in [5, 16, 32, 128]:
+            for n_ops in [2, 4, 16]:
+                ok &= check_adder_tree(arch, width, n_ops)
+
+    if ok:
+        print("\n[OK] Todas as arquiteturas de somador verificadas.")
+    else:
+        print("\n[ERRO] Há arquiteturas de somador com falha.")
+
+
+if __name__ == "__main__":
+    main()
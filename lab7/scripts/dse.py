@@ -5,9 +5,10 @@ Este módulo executa automaticamente a exploração de espaço de projeto (DSE)
 para o módulo neuron_intra_Nbits. Ele realiza as seguintes etapas:
 
 1. Modifica o RTL base para diferentes parâmetros de N e N_INPUTS.
-2. Executa a síntese usando o Cadence Genus.
-3. Faz o parsing dos relatórios de área, potência e timing.
-4. Registra os resultados em um arquivo CSV.
+2. Gera e verifica a árvore de somadores para cada arquitetura (adder_gen.py).
+3. Executa a síntese usando o Cadence Genus.
+4. Faz o parsing dos relatórios de área, potência e timing.
+5. Registra os resultados em um arquivo CSV.
 
 Cada passo está modularizado para permitir testes independentes.
 """
@@ -17,6 +18,8 @@ import math
 import csv
 import re
 
+from adder_gen import ADDER_ARCHS, check_adder_tree, write_adder_tree
+
 
 def modify_clock_constraint(sdc_path, period_ns):
     """
@@ -230,7 +233,7 @@ def parse_reports(report_dir, N_INPUTS):
     return area, power * 10**3, throughput, slack
 
 
-def write_result_to_csv(csv_path, N, N_INPUTS, area, power, throughput, slack, min_period):
+def write_result_to_csv(csv_path, N, N_INPUTS, ADDER_ARCH, area, power, throughput, slack, min_period):
     """
     Adiciona uma linha com os resultados no arquivo CSV de exploração.
 
@@ -242,6 +245,8 @@ def write_result_to_csv(csv_path, N, N_INPUTS, area, power, throughput, slack, m
         Valor do parâmetro N.
     N_INPUTS : int
         Valor do parâmetro N_INPUTS.
+    ADDER_ARCH : str
+        Arquitetura da árvore de somadores.
     area : float
         Área obtida da síntese.
     power : float
@@ -257,7 +262,7 @@ def write_result_to_csv(csv_path, N, N_INPUTS, area, power, throughput, slack, m
 
     file_exists = os.path.isfile(csv_path)
     with open(csv_path, 'a', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['N', 'N_INPUTS', 'Area(um^2)', 'Power(mW)', 'Throughput(Gops/s)', 'Slack(ps)', 'Min_Period(ns)']
+        fieldnames = ['N', 'N_INPUTS', 'ADDER_ARCH', 'Area(um^2)', 'Power(mW)', 'Throughput(Gops/s)', 'Slack(ps)', 'Min_Period(ns)']
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
 
         if not file_exists:
@@ -266,6 +271,7 @@ def write_result_to_csv(csv_path, N, N_INPUTS, area, power, throughput, slack, m
         writer.writerow({
             'N': N,
             'N_INPUTS': N_INPUTS,
+            'ADDER_ARCH': ADDER_ARCH,
             'Area(um^2)': area,
             'Power(mW)': power,
             'Throughput(Gops/s)': throughput,
@@ -278,11 +284,12 @@ def main():
     """
     Executa o fluxo completo de Design Space Exploration (DSE).
 
-    1. Modifica o RTL para diferentes valores de N e N_INPUTS.
-    2. Encontra o menor período sintetizável para cada configuração.
-    3. Executa a síntese final com o período otimizado.
-    4. Faz parsing dos relatórios.
-    5. Escreve os resultados no CSV.
+    1. Modifica o RTL para diferentes valores de N, N_INPUTS e ADDER_ARCH.
+    2. Gera a árvore de somadores e verifica sua funcionalidade.
+    3. Encontra o menor período sintetizável para cada configuração.
+    4. Executa a síntese final com o período otimizado.
+    5. Faz parsing dos relatórios.
+    6. Escreve os resultados no CSV.
 
     Returns
     -------
@@ -290,41 +297,51 @@ def main():
     """
     rtl_path = '../rtl/neuron_intra_Nbits_base.v'
     rtl_out_path = '../rtl/neuron_intra_Nbits.v'
+    adder_out_path = '../rtl/adder_tree_Nbits.v'
     sdc_path = '../constraints/constraints.sdc'
     csv_path = 'dse_results/results.csv'
 
     values_N = [8, 16, 64] 
     values_N_INP = [4, 8, 16]  
+    values_ARCH = list(ADDER_ARCHS)
 
     os.makedirs("dse_results", exist_ok=True)
 
-    for N in values_N:
-        for N_INPUTS in values_N_INP:
-            print(f"\n=== Sintetizando para N={N}, N_INPUTS={N_INPUTS} ===")
+    for ADDER_ARCH in values_ARCH:
+        for N in values_N:
+            for N_INPUTS in values_N_INP:
+                print(f"\n=== Sintetizando para N={N}, N_INPUTS={N_INPUTS}, ADDER_ARCH={ADDER_ARCH} ===")
+
+                # Etapa 1: Modifica o RTL
+                modify_rtl(rtl_path, rtl_out_path, N, N_INPUTS)
 
-            # Etapa 1: Modifica o RTL
-            modify_rtl(rtl_path, rtl_out_path, N, N_INPUTS)
+                # Etapa 2: Gera a árvore de somadores (produtos de 2*N bits) e verifica
+                write_adder_tree(adder_out_path, ADDER_ARCH, 2 * N, N_INPUTS)
+                if not check_adder_tree(ADDER_ARCH, 2 * N, N_INPUTS):
+                    print(f"[ERRO] Árvore {ADDER_ARCH} incorreta, configuração ignorada.")
+                    continue
 
-            # Etapa 2: Encontra o menor período sintetizável
-            min_period = find_minimum_period(sdc_path)
+                # Etapa 3: Encontra o menor período sintetizável
+                min_period = find_minimum_period(sdc_path)
 
-            # Etapa 3: Executa síntese final com período otimizado (para garantir)
-            modify_clock_constraint(sdc_path, min_period)
-            run_synthesis()
+                # Etapa 4: Executa síntese final com período otimizado (para garantir)
+                modify_clock_constraint(sdc_path, min_period)
+                run_synthesis()
 
-            # Etapa 4: Coleta resultados
-            area, power, _, slack = parse_reports('reports', N_INPUTS)
+                # Etapa 5: Coleta resultados
+                area, power, _, slack = parse_reports('reports', N_INPUTS)
 
-            # Etapa 5: Calcula throughput com período real encontrado
-            # Throughput = N_INPUTS operações / período (em segundos)
-            # Convertendo para Gops/s: operações / (período_ns * 1e-9) / 1e9
-            throughput = N_INPUTS / (min_period * 1e-9) / 1e9
+                # Etapa 6: Calcula throughput com período real encontrado
+                # Throughput = N_INPUTS operações / período (em segundos)
+                # Convertendo para Gops/s: operações / (período_ns * 1e-9) / 1e9
+                throughput = N_INPUTS / (min_period * 1e-9) / 1e9
 
-            # Etapa 6: Salva resultados no CSV
-            write_result_to_csv(csv_path, N, N_INPUTS, area, power, throughput, slack, min_period)
+                # Etapa 7: Salva resultados no CSV
+                write_result_to_csv(csv_path, N, N_INPUTS, ADDER_ARCH, area, power,
+                                    throughput, slack, min_period)
 
-            print(f"[OK] Configuração concluída - Área: {area:.2f}, Potência: {power:.3f} mW, "
-                  f"Throughput: {throughput:.3f} Gops/s, Período mín: {min_period:.3f} ns")
+                print(f"[OK] Configuração concluída - Área: {area:.2f}, Potência: {power:.3f} mW, "
+                      f"Throughput: {throughput:.3f} Gops/s, Período mín: {min_period:.3f} ns")
 
     print("\n[OK] Design Space Exploration concluída!")
     print(f"Resultados salvos em {csv_path}")
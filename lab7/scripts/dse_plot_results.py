@@ -19,6 +19,14 @@ df.columns = df.columns.str.strip()
 # Calculate maximum frequency (GHz) from minimum period (ns)
 df['Max_Frequency(GHz)'] = 1 / df['Min_Period(ns)']
 
+# Keep every adder architecture for the comparison plot; the remaining plots
+# use only the baseline (behavioral '+') adder tree
+if 'ADDER_ARCH' not in df.columns:
+    df['ADDER_ARCH'] = 'behavioral'
+df['ADDER_ARCH'] = df['ADDER_ARCH'].str.strip()
+df_arch = df.copy()
+df = df[df['ADDER_ARCH'] == 'behavioral'].reset_index(drop=True)
+
 # Create output directory if it doesn't exist
 output_dir = 'dse_results'
 os.makedirs(output_dir, exist_ok=True)
@@ -308,6 +316,37 @@ plt.savefig(f'{output_dir}/3d_area_power_throughput_fixed.png', dpi=300, bbox_in
 print(f"  ✓ Saved: {output_dir}/3d_area_power_throughput_fixed.png")
 plt.close()
 
+# ============================================================================
+# Plot 11: Adder Architecture Comparison (largest N_INPUTS)
+# ============================================================================
+arch_values = list(dict.fromkeys(df_arch['ADDER_ARCH']))
+n_inputs_max = df_arch['N_INPUTS'].max()
+data_arch = df_arch[df_arch['N_INPUTS'] == n_inputs_max]
+
+fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+metrics = [('Min_Period(ns)', 'Min Period (ns)'),
+           ('Area(um^2)', 'Area (μm²)'),
+           ('Power(mW)', 'Power (mW)')]
+bar_width = 0.8 / len(n_values)
+x = np.arange(len(arch_values))
+for ax, (column, label) in zip(axes, metrics):
+    for i, n in enumerate(n_values):
+        data = data_arch[data_arch['N'] == n].groupby('ADDER_ARCH')[column].mean()
+        heights = [data.get(arch, np.nan) for arch in arch_values]
+        ax.bar(x + i * bar_width, heights, bar_width, label=f'N={n}', color=colors[i])
+    ax.set_xticks(x + bar_width * (len(n_values) - 1) / 2)
+    ax.set_xticklabels(arch_values, rotation=30)
+    ax.set_ylabel(label, fontsize=12, fontweight='bold')
+    ax.set_title(f'{label} per Adder (N_INPUTS={n_inputs_max})', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
+    if column != 'Min_Period(ns)':
+        ax.set_yscale('log')
+plt.tight_layout()
+plt.savefig(f'{output_dir}/adder_arch_comparison.png', dpi=300, bbox_inches='tight')
+print(f"  ✓ Saved: {output_dir}/adder_arch_comparison.png")
+plt.close()
+
 # ============================================================================
 # Create summary statistics table
 # ============================================================================
@@ -317,6 +356,7 @@ print("="*70)
 print(f"\nDataset contains {len(df)} design points")
 print(f"N values: {n_values}")
 print(f"N_INPUTS values: {n_inputs_values}")
+print(f"Adder architectures: {arch_values}")
 print(f"\nArea range: {df['Area(um^2)'].min():.2f} - {df['Area(um^2)'].max():.2f} μm²")
 print(f"Power range: {df['Power(mW)'].min():.3f} - {df['Power(mW)'].max():.3f} mW")
 print(f"Throughput range: {df['Throughput(Gops/s)'].min():.2f} - {df['Throughput(Gops/s)'].max():.2f} GOPS/s")
@@ -5,7 +5,7 @@ set_db init_lib_search_path ../gpdk045_workspace/gsclib045_all_v4.4/gsclib045/ti
 
 read_libs { slow_vdd1v0_basicCells.lib }
 
-read_hdl neuron_intra_Nbits.v
+read_hdl { adder_tree_Nbits.v neuron_intra_Nbits.v }
 
 elaborate
 